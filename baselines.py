@@ -1,50 +1,108 @@
-import copy
+import heapq
+import math
+from bisect import bisect_right
 from collections import deque
+from itertools import accumulate, islice
+from operator import add, sub
 from typing import List, Dict, Tuple
 from job import Job, MetricCalculator
+from schedule_cache import memoize_schedule
+
+def _same_arrival(jobs: List[Job]) -> bool:
+    """True if every job arrives at the same time (e.g. a batch submitted at 0)"""
+    return all(job.arrival_time == jobs[0].arrival_time for job in jobs)
+
+
+def _run_back_to_back(jobs: List[Job], start_time: int):
+    """Run jobs in the given order with no idle time, starting at start_time"""
+    starts = accumulate((job.burst_time for job in jobs), initial=start_time)
+    for job, job_start in zip(jobs, starts):
+        job.start_time = job_start
+        job.completion_time = job_start + job.burst_time
+
+
+def _push_ready(available: list, index: int, job: Job):
+    """Push a job onto a ready heap: least remaining time first, ties to the job listed first"""
+    heapq.heappush(available, (job.remaining_time, index, job))
+
+
+def _admit_arrivals(jobs: List[Job], arrival_order: List[int], arrivals: List[int],
+                    next_arrival_idx: int, current_time: int, available: list) -> int:
+    """Push every job that has arrived by current_time onto available, returning the new cursor"""
+    while next_arrival_idx < len(jobs) and arrivals[next_arrival_idx] <= current_time:
+        i = arrival_order[next_arrival_idx]
+        _push_ready(available, i, jobs[i])
+        next_arrival_idx += 1
+    return next_arrival_idx
+
 
 class FIFOScheduler:
     """First In First Out Scheduler"""
     
-    def schedule(self, jobs: List[Job]) -> Tuple[List[Job], Dict]:
-        jobs = [copy.deepcopy(job) for job in jobs]
-        jobs.sort(key=lambda x: x.arrival_time)
+    @memoize_schedule()
+    def schedule(self, jobs: List[Job], pre_sorted: bool = False) -> Tuple[List[Job], Dict]:
+        jobs = [job.clone() for job in jobs]
         
-        current_time = 0
-        completed = []
+        # Fast path: if all jobs arrive together they just run back-to-back
+        if jobs and _same_arrival(jobs):
+            _run_back_to_back(jobs, max(0, jobs[0].arrival_time))
+            return jobs, MetricCalculator.calculate_metrics(jobs)
         
-        for job in jobs:
-            if current_time < job.arrival_time:
-                current_time = job.arrival_time
-            
-            job.start_time = current_time
-            current_time += job.burst_time
-            job.completion_time = current_time
-            completed.append(job)
+        if not pre_sorted:  # Caller may have already sorted by arrival time
+            jobs.sort(key=lambda x: x.arrival_time)
+        
+        # Each job starts at max(previous completion, its arrival), a prefix
+        # recurrence that unrolls to
+        #   completion[i] = total_burst[i] + max(0, arrival[j] - total_burst[j-1] for j <= i)
+        # so both prefixes come from accumulate() instead of a Python loop
+        bursts = [job.burst_time for job in jobs]
+        total_burst = list(accumulate(bursts))
+        arrival_slack = map(sub, (job.arrival_time for job in jobs), accumulate(bursts, initial=0))
+        delays = islice(accumulate(arrival_slack, max, initial=0), 1, None)
+        
+        for job, burst, completion_time in zip(jobs, bursts, map(add, total_burst, delays)):
+            job.start_time = completion_time - burst
+            job.completion_time = completion_time
  
-        return completed, MetricCalculator.calculate_metrics(completed)
+        return jobs, MetricCalculator.calculate_metrics(jobs)
 
 
 class SJFScheduler:
     """Shortest Job First Scheduler"""
     
-    def schedule(self, jobs: List[Job]) -> Tuple[List[Job], Dict]:
-        jobs = [copy.deepcopy(job) for job in jobs]
+    @memoize_schedule()
+    def schedule(self, jobs: List[Job], pre_sorted: bool = False) -> Tuple[List[Job], Dict]:
+        """Ties go to the job listed first in jobs (pre_sorted is accepted like the other schedulers but unused)"""
+        jobs = [job.clone() for job in jobs]
+        
+        # Fast path: if all jobs arrive together, SJF is just a (stable) sort by burst time
+        if jobs and _same_arrival(jobs):
+            completed = sorted(jobs, key=lambda x: x.burst_time)
+            _run_back_to_back(completed, max(0, jobs[0].arrival_time))
+            return completed, MetricCalculator.calculate_metrics(completed)
+        
         current_time = 0
         completed = []
-        remaining = jobs[:]
+        # Input positions in arrival order, with their arrival times alongside
+        arrival_order = sorted(range(len(jobs)), key=lambda i: jobs[i].arrival_time)
+        arrivals = [jobs[i].arrival_time for i in arrival_order]
+        next_arrival_idx = 0
+        # Jobs that have arrived but not run, as a min-heap of (remaining_time, index, job)
+        # (nothing has run yet, so remaining_time is the burst time)
+        available = []
         
-        while remaining:
-            # Get available jobs
-            available = [j for j in remaining if j.arrival_time <= current_time]
+        while next_arrival_idx < len(jobs) or available:
+            # Add newly arrived jobs
+            next_arrival_idx = _admit_arrivals(jobs, arrival_order, arrivals, next_arrival_idx,
+                                               current_time, available)
             
             if not available:
-                current_time = min(j.arrival_time for j in remaining)
+                # Fast-forward to the next arrival
+                current_time = arrivals[next_arrival_idx]
                 continue
             
-            # Pick shortest job
-            job = min(available, key=lambda x: x.burst_time)
-            remaining.remove(job)
+            # Pick shortest job (ties go to the job listed first)
+            _, _, job = heapq.heappop(available)
             
             job.start_time = current_time
             current_time += job.burst_time
@@ -57,34 +115,62 @@ class SJFScheduler:
 class STCFScheduler:
     """Shortest Time-to-Completion First Scheduler"""
     
-    def schedule(self, jobs: List[Job]) -> Tuple[List[Job], Dict]:
-        jobs = [copy.deepcopy(job) for job in jobs]
+    @memoize_schedule()
+    def schedule(self, jobs: List[Job], pre_sorted: bool = False) -> Tuple[List[Job], Dict]:
+        """Ties go to the job listed first in jobs (pre_sorted is accepted like the other schedulers but unused)"""
+        jobs = [job.clone() for job in jobs]
         current_time = 0
         completed = []
-        remaining = jobs[:]
+        # Input positions in arrival order, with their arrival times alongside
+        arrival_order = sorted(range(len(jobs)), key=lambda i: jobs[i].arrival_time)
+        arrivals = [jobs[i].arrival_time for i in arrival_order]
+        next_arrival_idx = 0
+        # Jobs that have arrived but not finished, as a min-heap of (remaining_time, index, job)
+        available = []
         
-        while remaining:
-            # Get available jobs
-            available = [j for j in remaining if j.arrival_time <= current_time]
+        while next_arrival_idx < len(jobs) or available:
+            # Add newly arrived jobs
+            next_arrival_idx = _admit_arrivals(jobs, arrival_order, arrivals, next_arrival_idx,
+                                               current_time, available)
+            next_arrival = arrivals[next_arrival_idx] if next_arrival_idx < len(jobs) else math.inf
             
             if not available:
-                current_time = min(j.arrival_time for j in remaining)
+                current_time = next_arrival
                 continue
             
-            # Pick job with shortest remaining time
-            job = min(available, key=lambda x: x.remaining_time)
+            # Pick job with shortest remaining time (ties go to the job listed first)
+            _, job_idx, job = heapq.heappop(available)
             
             if job.start_time == -1:
                 job.start_time = current_time
             
-            # Execute for 1 time unit
-            job.remaining_time -= 1
-            current_time += 1
-            
-            if job.remaining_time == 0:
-                job.completion_time = current_time
-                completed.append(job)
-                remaining.remove(job)
+            # Preemption can only happen when a new job arrives, and only by a
+            # job with less time left, so keep running this job across
+            # arrivals until it finishes or one of them beats it
+            while True:
+                exec_time = job.remaining_time
+                if next_arrival_idx < len(jobs):
+                    # A running job advances time in whole units, so an arrival
+                    # partway through one is seen at the end of it
+                    exec_time = min(exec_time, math.ceil(next_arrival - current_time))
+                job.remaining_time -= exec_time
+                current_time += exec_time
+                
+                if job.remaining_time == 0:
+                    job.completion_time = current_time
+                    completed.append(job)
+                    break
+                
+                next_arrival_idx = _admit_arrivals(jobs, arrival_order, arrivals, next_arrival_idx,
+                                                   current_time, available)
+                next_arrival = arrivals[next_arrival_idx] if next_arrival_idx < len(jobs) else math.inf
+                
+                # Jobs already waiting were behind this one and still are, so only
+                # the heap top (possibly a new arrival) can preempt it
+                top_remaining, top_idx, _ = available[0]
+                if (top_remaining, top_idx) < (job.remaining_time, job_idx):
+                    _push_ready(available, job_idx, job)
+                    break
         
         return completed, MetricCalculator.calculate_metrics(completed)
 
@@ -94,22 +180,51 @@ class RoundRobinScheduler:
     def __init__(self, time_quantum=2):
         self.time_quantum = time_quantum
     
-    def schedule(self, jobs: List[Job]) -> Tuple[List[Job], Dict]:
-        jobs = [copy.deepcopy(job) for job in jobs]
+    @memoize_schedule('time_quantum')
+    def schedule(self, jobs: List[Job], pre_sorted: bool = False) -> Tuple[List[Job], Dict]:
+        jobs = [job.clone() for job in jobs]
         current_time = 0
         completed = []
         ready_queue = deque()
-        waiting_jobs = sorted(jobs, key=lambda x: x.arrival_time)
+        # Caller may have already sorted by arrival time
+        waiting_jobs = jobs if pre_sorted else sorted(jobs, key=lambda x: x.arrival_time)
+        arrival_keys = [job.arrival_time for job in waiting_jobs]
+        num_jobs = len(waiting_jobs)
+        next_arrival_idx = 0  # Next job in waiting_jobs to arrive
+        slices_until_check = 0  # Slices left before the next whole-rotation check
         
-        while waiting_jobs or ready_queue:
-            # Add newly arrived jobs
-            while waiting_jobs and waiting_jobs[0].arrival_time <= current_time:
-                ready_queue.append(waiting_jobs.pop(0))
+        while next_arrival_idx < num_jobs or ready_queue:
+            # Add newly arrived jobs (bisect finds where they end in one step;
+            # most slices have none, so check the next arrival first)
+            if next_arrival_idx < num_jobs and arrival_keys[next_arrival_idx] <= current_time:
+                arrived_idx = bisect_right(arrival_keys, current_time, next_arrival_idx)
+                ready_queue.extend(waiting_jobs[next_arrival_idx:arrived_idx])
+                next_arrival_idx = arrived_idx
             
             if not ready_queue:
-                current_time = waiting_jobs[0].arrival_time
+                current_time = arrival_keys[next_arrival_idx]
                 continue
             
+            # Between arrivals the queue just rotates: each job gets a full
+            # quantum per rotation and the order doesn't change. Skip as many
+            # whole rotations as fit before a job could finish or a new one
+            # arrives. Checked once per rotation, so the scan stays cheap.
+            if slices_until_check == 0:
+                slices_until_check = len(ready_queue)
+                rotation_time = len(ready_queue) * self.time_quantum
+                rotations = (min(j.remaining_time for j in ready_queue) - 1) // self.time_quantum
+                if next_arrival_idx < num_jobs:
+                    time_to_arrival = arrival_keys[next_arrival_idx] - current_time
+                    rotations = min(rotations, (time_to_arrival - 1) // rotation_time)
+                
+                if rotations > 0:
+                    for position, queued_job in enumerate(ready_queue):
+                        if queued_job.start_time == -1:
+                            queued_job.start_time = current_time + position * self.time_quantum
+                        queued_job.remaining_time -= rotations * self.time_quantum
+                    current_time += rotations * rotation_time
+            slices_until_check -= 1
+            
             job = ready_queue.popleft()
             
             if job.start_time == -1:
@@ -121,8 +236,10 @@ class RoundRobinScheduler:
             current_time += exec_time
             
             # Add jobs that arrived during execution
-            while waiting_jobs and waiting_jobs[0].arrival_time <= current_time:
-                ready_queue.append(waiting_jobs.pop(0))
+            if next_arrival_idx < num_jobs and arrival_keys[next_arrival_idx] <= current_time:
+                arrived_idx = bisect_right(arrival_keys, current_time, next_arrival_idx)
+                ready_queue.extend(waiting_jobs[next_arrival_idx:arrived_idx])
+                next_arrival_idx = arrived_idx
             
             if job.remaining_time > 0:
                 ready_queue.append(job)
@@ -18,14 +18,16 @@ Example with 2 jobs (A and B):
 - ... and so on, alternating fairly
 
 Ours is simpler than real Linux CFS which uses:
-- Red-black trees for O(log n) selection
+- Red-black trees for O(log n) selection (we use a binary heap)
 - Nice values/weights for priority
 - Target latency and minimum granularity
 """
 
-import copy
+import heapq
+import math
 from typing import List, Dict, Tuple
 from job import Job, MetricCalculator
+from schedule_cache import memoize_schedule
 
 
 class CFSScheduler:
@@ -44,96 +46,141 @@ class CFSScheduler:
         """
         self.min_granularity = min_granularity
     
-    def schedule(self, jobs: List[Job]) -> Tuple[List[Job], Dict]:
+    @memoize_schedule('min_granularity')
+    def schedule(self, jobs: List[Job], pre_sorted: bool = False) -> Tuple[List[Job], Dict]:
         """
         Run CFS scheduling simulation.
         
         Args:
             jobs: List of jobs to schedule
+            pre_sorted: True if jobs are already sorted by arrival time
             
         Returns:
             Tuple of (completed_jobs, metrics_dict)
         """
-        # Deep copy jobs so we don't modify the originals
-        jobs = [copy.deepcopy(job) for job in jobs]
+        # Copy jobs so we don't modify the originals
+        jobs = [job.clone() for job in jobs]
         current_time = 0
         completed = []
         
         # Jobs that haven't arrived yet, sorted by arrival time
-        waiting_jobs = sorted(jobs, key=lambda x: x.arrival_time)
+        # next_arrival_idx points at the next job to arrive (avoids O(n) pop(0))
+        waiting_jobs = jobs if pre_sorted else sorted(jobs, key=lambda x: x.arrival_time)
+        next_arrival_idx = 0
         
         
-        # vruntime tracks how much CPU time each job has "fairly" received
+        # Jobs that are ready to run (have arrived), kept as a min-heap of
+        # (vruntime, arrival_order, job) tuples
+        # job.vruntime tracks how much CPU time each job has "fairly" received
         # Lower vruntime = job deserves more CPU time
-        # Dictionary: job_id -> vruntime value
-        vruntime = {}
-        
-        # Jobs that are ready to run (have arrived)
+        # arrival_order breaks ties in favor of the job that arrived first
         ready_jobs = []
+        arrival_order = 0
+        
+        # Baseline vruntime handed to arriving jobs: the lowest vruntime among
+        # ready and running jobs. Only arrivals read it, so it is refreshed
+        # lazily right before they are added, and reset to 0 once nothing is
+        # ready so vruntimes start small again (like min_vruntime in Linux)
+        min_vruntime = 0
+        
+        # Bind hot-loop lookups to locals (cheaper than module/attribute lookups)
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        num_jobs = len(waiting_jobs)
         
         
         #  MAIN SCHEDULING LOOP
         
-        while waiting_jobs or ready_jobs:
+        while next_arrival_idx < num_jobs or ready_jobs:
             # Add newly arrived jobs to ready queue
             
             # When a new job arrives, give it the minimum vruntime of all
             # currently ready jobs. This ensures new jobs get scheduled
             # soon (they're not stuck behind jobs with high vruntime).
-            while waiting_jobs and waiting_jobs[0].arrival_time <= current_time:
-                job = waiting_jobs.pop(0)
+            while next_arrival_idx < num_jobs and waiting_jobs[next_arrival_idx].arrival_time <= current_time:
+                job = waiting_jobs[next_arrival_idx]
+                next_arrival_idx += 1
                 
                 # New job gets min vruntime so it gets a fair chance
-                # If no jobs exist yet, start at 0
-                min_vruntime = min(vruntime.values()) if vruntime else 0
-                vruntime[job.job_id] = min_vruntime
-                ready_jobs.append(job)
+                # If no jobs exist yet, this is 0
+                job.vruntime = min_vruntime
+                heappush(ready_jobs, (job.vruntime, arrival_order, job))
+                arrival_order += 1
             
         
             #  Handle idle CPU (no ready jobs)
         
             if not ready_jobs:
                 # Fast-forward time to next job arrival
-                current_time = waiting_jobs[0].arrival_time
+                current_time = waiting_jobs[next_arrival_idx].arrival_time
                 continue
             
             
             # Pick the job with LOWEST vruntime
-            # the least CPU time so far
+            # the least CPU time so far (O(log n), like the red-black tree in Linux)
 
-            job = min(ready_jobs, key=lambda j: vruntime[j.job_id])
+            _, order, job = heappop(ready_jobs)
             
             # Record first time this job runs (for response time calculation)
             if job.start_time == -1:
                 job.start_time = current_time
             
             
-            # Execute the job for 1 time unit
+            # Work out how long this job stays the lowest-vruntime job.
+            # The choice can only change when:
+            #  - the job finishes
+            #  - a new job arrives
+            #  - its vruntime passes the next lowest ready job (the heap top)
+            #    (on a tie, the job that arrived first wins)
+            exec_time = job.remaining_time
+            
+            if next_arrival_idx < num_jobs:
+                # Time advances in whole units while a job runs, so an arrival
+                # partway through one is seen at the end of it
+                exec_time = min(exec_time, math.ceil(waiting_jobs[next_arrival_idx].arrival_time - current_time))
             
-            job.remaining_time -= 1
-            current_time += 1
+            if ready_jobs:
+                next_vruntime, next_order, _ = ready_jobs[0]
+                gap = next_vruntime - job.vruntime
+                if order < next_order:
+                    gap += 1  # Still wins the tie once vruntimes are equal
+                exec_time = min(exec_time, gap)
+            
+            
+            # Execute the job until the next scheduling decision
+            
+            job.remaining_time -= exec_time
+            current_time += exec_time
             
             # Increase vruntime as the job uses CPU
             # This makes other jobs more likely to be picked next
-            vruntime[job.job_id] += 1
+            job.vruntime += exec_time
             
             
             # Check for new arrivals during execution
+            # The running job may no longer hold the minimum, so refresh the
+            # baseline first (it is out of the heap, so compare against the heap top)
            
-            while waiting_jobs and waiting_jobs[0].arrival_time <= current_time:
-                new_job = waiting_jobs.pop(0)
-                min_vruntime = min(vruntime.values()) if vruntime else 0
-                vruntime[new_job.job_id] = min_vruntime
-                ready_jobs.append(new_job)
+            if next_arrival_idx < num_jobs and waiting_jobs[next_arrival_idx].arrival_time <= current_time:
+                min_vruntime = min(job.vruntime, ready_jobs[0][0]) if ready_jobs else job.vruntime
+            
+            while next_arrival_idx < num_jobs and waiting_jobs[next_arrival_idx].arrival_time <= current_time:
+                new_job = waiting_jobs[next_arrival_idx]
+                next_arrival_idx += 1
+                new_job.vruntime = min_vruntime
+                heappush(ready_jobs, (new_job.vruntime, arrival_order, new_job))
+                arrival_order += 1
             
             
-            # Check if job completed
+            # Check if job completed, otherwise put it back with its new vruntime
 
             if job.remaining_time == 0:
                 job.completion_time = current_time
                 completed.append(job)
-                ready_jobs.remove(job)
-                del vruntime[job.job_id]  # Clean up vruntime tracking
+                if not ready_jobs:
+                    min_vruntime = 0
+            else:
+                heappush(ready_jobs, (job.vruntime, order, job))
         
         # Calculate and return metrics
         return completed, MetricCalculator.calculate_metrics(completed)
@@ -1,9 +1,10 @@
-from collections import deque
-from dataclasses import dataclass
-from typing import List, Dict
-import statistics
+import sys
+from dataclasses import dataclass, field
+from typing import List, Dict, Tuple
 
-@dataclass
+NO_IO = sys.maxsize  # next_io value once a job has no I/O operations left
+
+@dataclass(slots=True)
 class Job:
     """Represents a job in the system"""
     job_id: int
@@ -17,22 +18,58 @@ class Job:
     waiting_for_io: bool = False # Flag to indicate if job is waiting for IO
     io_return_time: int = -1
     io_duration: int = 5  # Default IO duration, can change as desired
-    io_operations: deque[int] = None  # store as deque
+    io_operations: Tuple[int, ...] = None  # CPU times that trigger IO, stored as a sorted (immutable) tuple
+    # Cursor state, not set by callers: index of the next IO operation in io_operations,
+    # and that operation's CPU time cached so needs_io is a single compare
+    io_idx: int = field(default=0, init=False, repr=False, compare=False)
+    next_io: int = field(default=NO_IO, init=False, repr=False, compare=False)
+    vruntime: int = field(default=0, init=False, repr=False, compare=False)  # CPU time "fairly" received so far, used by CFS
+    cpu_time_used: int = field(default=0, init=False, repr=False, compare=False)  # CPU time received so far, used by MLFQ to find IO points
 
     def __post_init__(self):
         self.remaining_time = self.burst_time # Initialize remaining_time, set to burst_time to start
-        if self.io_operations is None:
-            self.io_operations = deque()
-        else:
-            # Ensure io_operations is sorted, earlier times first
-            self.io_operations = deque(sorted(self.io_operations))
+        # Ensure io_operations is sorted, earlier times first
+        self.io_operations = tuple(sorted(self.io_operations or ()))
+        self._update_next_io()
+
+    def clone(self) -> 'Job':
+        """Return a fresh, unscheduled copy of this job"""
+        # Direct constructor call, much cheaper than copy.deepcopy
+        job = Job(self.job_id, self.arrival_time, self.burst_time, self.burst_time, self.priority,
+                  io_duration=self.io_duration)
+        # io_operations is immutable, so the copy shares it and only takes the cursor
+        job.io_operations = self.io_operations
+        job.io_idx = self.io_idx
+        job.next_io = self.next_io
+        return job
+
+    def __copy__(self) -> 'Job':
+        # Copy the slots directly instead of going through __reduce_ex__
+        job = Job.__new__(Job)
+        for name in Job.__slots__:
+            setattr(job, name, getattr(self, name))
+        return job
+
+    def __deepcopy__(self, memo) -> 'Job':
+        # Every field is an int, a bool or the immutable io_operations tuple,
+        # so a shallow copy is already a deep one
+        job = self.__copy__()
+        memo[id(self)] = job
+        return job
 
     def needs_io(self, cpu_time_used: int) -> bool:
         # Check if job needs to perform I/O at this CPU time
-        if self.io_operations and cpu_time_used == self.io_operations[0]:
-            self.io_operations.popleft()  # consume the event (ensure its removed from the queue)
+        if cpu_time_used == self.next_io:
+            self.io_idx += 1  # consume the event (move the cursor past it)
+            self._update_next_io()
             return True
         return False
+
+    def _update_next_io(self):
+        if self.io_idx < len(self.io_operations):
+            self.next_io = self.io_operations[self.io_idx]
+        else:
+            self.next_io = NO_IO
     
 class MetricCalculator:
     """Utility class to calculate scheduling metrics"""
@@ -42,9 +79,10 @@ class MetricCalculator:
         turnaround_times = [j.completion_time - j.arrival_time for j in completed]
         response_times = [j.start_time - j.arrival_time for j in completed]
         
+        # sum/len instead of statistics.mean, which does exact fraction arithmetic
         return {
-            'avg_turnaround': statistics.mean(turnaround_times),
-            'avg_response': statistics.mean(response_times),
+            'avg_turnaround': sum(turnaround_times) / len(turnaround_times),
+            'avg_response': sum(response_times) / len(response_times),
             'turnaround_times': turnaround_times,
             'response_times': response_times
-        }
\ No newline at end of file
+        }
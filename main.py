@@ -1,3 +1,4 @@
+from operator import mul
 from typing import List
 from mlfq import MLFQScheduler
 from baselines import FIFOScheduler, SJFScheduler, STCFScheduler, RoundRobinScheduler
@@ -10,7 +11,7 @@ def calculate_jains_fairness(values: List[float]) -> float:
     """
     if not values:
         return 0.0
-    denom = sum(v * v for v in values)
+    denom = sum(map(mul, values, values))  # Sum of squares, without a Python-level loop
     if denom == 0:
         return 0.0
     total = sum(values)
@@ -33,14 +34,30 @@ def compare_schedulers(jobs: List[Job]):
     print("SCHEDULER COMPARISON")
     print("=" * 80)
     
+    # Sort by arrival once instead of in every scheduler (the sort is stable,
+    # so jobs arriving together keep their input order for tie-breaks)
+    jobs_by_arrival = sorted(jobs, key=lambda x: x.arrival_time)
+    
+    all_metrics = {}
     for name, scheduler in schedulers.items():
-        completed, metrics = scheduler.schedule(jobs)
-        
+        completed, metrics = scheduler.schedule(jobs_by_arrival, pre_sorted=True)
+        all_metrics[name] = metrics
+    
+    # Every scheduler ran the same job set, so compute all the fairness
+    # indices in one batch up front and keep the print loop formatting only
+    fairness = {
+        name: (calculate_jains_fairness(metrics['turnaround_times']),
+               calculate_jains_fairness(metrics['response_times']))
+        for name, metrics in all_metrics.items()
+    }
+    
+    for name, metrics in all_metrics.items():
+        turnaround_fairness, response_fairness = fairness[name]
         print(f"\n{name}:")
         print(f"  Average Turnaround Time: {metrics['avg_turnaround']:.2f}")
         print(f"  Average Response Time: {metrics['avg_response']:.2f}")
-        print(f"  Jain's Fairness Index (turnaround): {calculate_jains_fairness(metrics['turnaround_times']):.4f}")
-        print(f"  Jain's Fairness Index (response): {calculate_jains_fairness(metrics['response_times']):.4f}")
+        print(f"  Jain's Fairness Index (turnaround): {turnaround_fairness:.4f}")
+        print(f"  Jain's Fairness Index (response): {response_fairness:.4f}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,50 @@
-import copy
+import heapq
+import math
+from array import array
+from bisect import bisect_right
 from collections import deque
+from itertools import chain
 from typing import List, Dict, Tuple
 from job import Job, MetricCalculator
+from schedule_cache import memoize_schedule
+
+# Timeline states, stored as small int codes; STATE_NAMES maps a code back to its name
+RUNNING, IO, IDLE = 0, 1, 2
+STATE_NAMES = ("RUNNING", "IO", "IDLE")
+
+class Timeline:
+    """MLFQ timeline as run-length encoded (start, end, job_id, priority, state) segments
+    
+    Segments are kept in parallel columns: times, priorities and RUNNING/IO/IDLE
+    state codes in typed arrays, job IDs (whatever the caller used) in a list.
+    Times are whole time units. Iterating yields the state names
+    """
+    
+    def __init__(self, starts=(), ends=(), job_ids=(), priorities=(), states=()):
+        self.starts = array('q', starts)
+        self.ends = array('q', ends)
+        self.job_ids = list(job_ids)
+        self.priorities = array('q', priorities)
+        self.states = array('b', states)
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def __iter__(self):
+        return zip(self.starts, self.ends, self.job_ids, self.priorities,
+                   map(STATE_NAMES.__getitem__, self.states))
+    
+    def __copy__(self):
+        # Copy the columns too, so a copy can't change the original
+        return Timeline(self.starts, self.ends, self.job_ids, self.priorities, self.states)
+
+
+def timeline_expand(timeline):
+    """Yield a (time, job_id, priority, state) record for every time unit in the timeline segments"""
+    for start, end, job_id, priority, state in timeline:
+        for time in range(start, end):
+            yield time, job_id, priority, state
+
 
 class MLFQScheduler:
     """Multi-Level Feedback Queue Scheduler"""
@@ -24,45 +67,67 @@ class MLFQScheduler:
         self.time_allotments = [2*q for q in self.time_quantum] if time_allotments is None else time_allotments
             
         self.boost_interval = boost_interval
-        self.time_since_boost = 0
         
-    def schedule(self, jobs: List[Job]) -> Tuple[List[Job], Dict]:
-        """Run MLFQ scheduling simulation"""
-        jobs = [copy.deepcopy(job) for job in jobs]
+    @memoize_schedule('num_queues', 'time_quantum', 'time_allotments', 'boost_interval')
+    def schedule(self, jobs: List[Job], pre_sorted: bool = False) -> Tuple[List[Job], Dict]:
+        """Run MLFQ scheduling simulation (pre_sorted: jobs already sorted by arrival time)"""
+        jobs = [job.clone() for job in jobs]
         current_time = 0
         completed = []
-        waiting_jobs = sorted(jobs, key=lambda x: x.arrival_time)
-        io_jobs = []  # Jobs waiting for IO to complete
+        waiting_jobs = jobs if pre_sorted else sorted(jobs, key=lambda x: x.arrival_time)
+        # The simulation runs in whole time units, so a job arriving partway
+        # through one is picked up at the start of the next
+        arrival_keys = [math.ceil(job.arrival_time) for job in waiting_jobs]
+        next_arrival_idx = 0  # Next job in waiting_jobs to arrive
+        # Jobs waiting for IO to complete, as a min-heap of (return_time, io_seq, job)
+        # io_seq keeps jobs returning at the same time in the order they left
+        io_jobs = []
+        io_seq = 0
         current_job = None
         quantum_remaining = 0 # Time left in current job's quantum
-        cpu_time_used = 0  # Track how much CPU time current job has used
         
-        timeline = []  # For visualization
+        # For visualization: a new timeline segment starts whenever the running
+        # (job_id, priority, state) changes, and ends where the next one starts
+        segment_starts = []
+        segments = []
+        last_segment = None
+        
+        # Bind settings used every iteration to locals (cheaper than attribute lookups)
+        queues = self.queues
+        num_queues = self.num_queues
+        time_quantum = self.time_quantum
+        time_allotments = self.time_allotments
+        num_jobs = len(waiting_jobs)
+        mask = 0  # Bit p is set while queues[p] has jobs
+        
+        # Boosts fire every boost_interval time units, so schedule the first one up front
+        boost_interval = self.boost_interval
+        next_boost = boost_interval if boost_interval else math.inf
         
         # Main scheduling loop
-        while waiting_jobs or any(self.queues) or current_job or io_jobs:
+        while next_arrival_idx < num_jobs or mask or current_job or io_jobs:
             # Priority boost if enough time has passed
-            if self.boost_interval and self.time_since_boost >= self.boost_interval:
-                self._boost_all_jobs(current_job)
-                self.time_since_boost = 0
+            if current_time >= next_boost:
+                mask = self._boost_all_jobs(current_job, mask)
+                next_boost += boost_interval
             
             # Check for IO completions and add back to ready queue, put back at same priority
-            jobs_returned = []
-            for job in io_jobs:
-                if current_time >= job.io_return_time:
-                    job.waiting_for_io = False
-                    self.queues[job.priority].append(job)
-                    jobs_returned.append(job)
-            
-            for job in jobs_returned:
-                io_jobs.remove(job)
+            while io_jobs and io_jobs[0][0] <= current_time:
+                _, _, job = heapq.heappop(io_jobs)
+                job.waiting_for_io = False
+                queues[job.priority].append(job)
+                mask |= 1 << job.priority
             
             # Add newly arrived jobs to highest priority queue
-            while waiting_jobs and waiting_jobs[0].arrival_time <= current_time:
-                job = waiting_jobs.pop(0)
-                job.priority = 0
-                job.time_in_queue = 0
-                self.queues[0].append(job)
+            if next_arrival_idx < num_jobs and arrival_keys[next_arrival_idx] <= current_time:
+                arrived_idx = bisect_right(arrival_keys, current_time, next_arrival_idx)
+                arrived = waiting_jobs[next_arrival_idx:arrived_idx]
+                for job in arrived:
+                    job.priority = 0
+                    job.time_in_queue = 0
+                queues[0].extend(arrived)
+                mask |= 1
+                next_arrival_idx = arrived_idx
             
             # If current job finished its quantum, completed, or went to IO
             if current_job and (quantum_remaining <= 0 or current_job.remaining_time <= 0 or current_job.waiting_for_io):
@@ -70,83 +135,117 @@ class MLFQScheduler:
                     current_job.completion_time = current_time
                     completed.append(current_job)
                     current_job = None
-                    cpu_time_used = 0
                 elif current_job.waiting_for_io:
                     # Job had IO, does not get demoted yet
-                    io_jobs.append(current_job)
+                    # It is first checked for return on the next time unit, so
+                    # an IO shorter than that comes back then
+                    return_time = max(math.ceil(current_job.io_return_time), current_time + 1)
+                    heapq.heappush(io_jobs, (return_time, io_seq, current_job))
+                    io_seq += 1
                     current_job = None
-                    cpu_time_used = 0
                 else:
                     # Check if job exhausted time allotment at current level
-                    if current_job.time_in_queue >= self.time_allotments[current_job.priority]:
+                    if current_job.time_in_queue >= time_allotments[current_job.priority]:
                         # If so, demote to lower priority
-                        current_job.priority = min(current_job.priority + 1, self.num_queues - 1)
+                        current_job.priority = min(current_job.priority + 1, num_queues - 1)
                         current_job.time_in_queue = 0
                     
                     # Put back in appropriate queue
-                    self.queues[current_job.priority].append(current_job)
+                    queues[current_job.priority].append(current_job)
+                    mask |= 1 << current_job.priority
                     current_job = None
-                    cpu_time_used = 0
             
             # Select next job, search for highest job in queues, otherwise round robin within same priority
             # If there are no more jobs, current_job remains None
-            if not current_job:
-                for priority in range(self.num_queues):
-                    if self.queues[priority]:
-                        current_job = self.queues[priority].popleft()
-                        quantum_remaining = self.time_quantum[priority]
-                        cpu_time_used = 0
-                        if current_job.start_time == -1:
-                            current_job.start_time = current_time
-                        break
+            if not current_job and mask:
+                # Lowest set bit of the mask is the highest non-empty priority
+                priority = (mask & -mask).bit_length() - 1
+                queue = queues[priority]
+                current_job = queue.popleft()
+                if not queue:
+                    mask &= ~(1 << priority)
+                quantum_remaining = time_quantum[priority]
+                if current_job.start_time == -1:
+                    current_job.start_time = current_time
             
             # Execute current job
-            if current_job:
-                # Check if job needs IO before executing this time unit
-                total_cpu_time = current_job.burst_time - current_job.remaining_time # how much time job has used so far
-                if current_job.needs_io(total_cpu_time):
-                    # Job relinquishes CPU for IO
-                    current_job.waiting_for_io = True
-                    current_job.io_return_time = current_time + current_job.io_duration # set when job will return from IO
-                    timeline.append((current_time, current_job.job_id, current_job.priority, "IO"))
-                else:
-                    # Otherwise, execute for 1 time unit
-                    current_job.remaining_time -= 1
-                    current_job.time_in_queue += 1
-                    quantum_remaining -= 1
-                    cpu_time_used += 1
-                    timeline.append((current_time, current_job.job_id, current_job.priority, "RUNNING"))
+            if current_job and current_job.needs_io(current_job.cpu_time_used):
+                # Job relinquishes CPU for IO (this takes one time unit)
+                current_job.waiting_for_io = True
+                current_job.io_return_time = current_time + current_job.io_duration # set when job will return from IO
+                run_time = 1
+                segment = (current_job.job_id, current_job.priority, IO)
             else:
-                # CPU is idle, no job to run
-                timeline.append((current_time, -1, -1, "IDLE"))
+                if current_job:
+                    # Otherwise, execute until the quantum runs out, the job finishes,
+                    # the job reaches its next IO operation, or the next event below
+                    # (each is at least one time unit away, so a one-unit quantum settles it)
+                    run_time = quantum_remaining
+                    if run_time > 1:
+                        until_io = current_job.next_io - current_job.cpu_time_used
+                        if until_io < 0:
+                            until_io = math.inf  # IO point already passed, it will never trigger
+                        run_time = min(run_time, current_job.remaining_time, until_io)
+                elif next_arrival_idx < num_jobs or io_jobs:
+                    run_time = math.inf  # CPU is idle until the next event
+                else:
+                    run_time = 1  # No job is still to come, this is the final time unit of the run
+                
+                # Nothing about the schedule changes before the next job arrival,
+                # IO return or priority boost, so run up to it in one step instead
+                # of one time unit per iteration. With short quanta most runs are
+                # a single time unit anyway, so only look when it could matter
+                if run_time > 1:
+                    if next_arrival_idx < num_jobs:
+                        run_time = min(run_time, arrival_keys[next_arrival_idx] - current_time)
+                    if io_jobs:
+                        run_time = min(run_time, io_jobs[0][0] - current_time)
+                    # (always at least the one time unit the per-tick loop would have run)
+                    run_time = max(1, min(run_time, next_boost - current_time))
+                
+                if current_job:
+                    current_job.remaining_time -= run_time
+                    current_job.time_in_queue += run_time
+                    quantum_remaining -= run_time
+                    current_job.cpu_time_used += run_time
+                    segment = (current_job.job_id, current_job.priority, RUNNING)
+                else:
+                    segment = (-1, -1, IDLE)
             
-            # Update time counters
-            current_time += 1
-            self.time_since_boost += 1
+            if segment != last_segment:
+                segment_starts.append(current_time)
+                segments.append(segment)
+                last_segment = segment
+            current_time += run_time
         
         # Calculate metrics
         metrics = MetricCalculator.calculate_metrics(completed)
-        metrics['timeline'] = timeline # For visualization
+        job_ids, priorities, states = zip(*segments) if segments else ((), (), ())
+        metrics['timeline'] = Timeline(segment_starts, segment_starts[1:] + [current_time],
+                                       job_ids, priorities, states)  # For visualization
         return completed, metrics
     
-    def _boost_all_jobs(self, current_job):
-        """Move all jobs to highest priority queue"""
-        all_jobs = []
+    def _boost_all_jobs(self, current_job, mask):
+        """Move all jobs to highest priority queue, returning the new nonempty-queue mask"""
+        if not mask and not current_job:
+            return mask  # Nothing to boost
+        
+        # Everything ends up in the top queue in the order it was queued, so
+        # splice the lower queues onto it instead of moving jobs one at a time
+        top_queue = self.queues[0]
+        lower_queues = self.queues[1:]
+        top_queue.extend(chain.from_iterable(lower_queues))
+        for q in lower_queues:
+            q.clear()
         
-        # Boost jobs from all queues
-        for q in self.queues:
-            while q:
-                job = q.popleft()
-                # Reset priority and time in queue
-                job.priority = 0
-                job.time_in_queue = 0
-                all_jobs.append(job)
+        # Reset priority and time in queue
+        for job in top_queue:
+            job.priority = 0
+            job.time_in_queue = 0
         
         # Boost current job too
         if current_job:
             current_job.priority = 0
             current_job.time_in_queue = 0
         
-        # Put all jobs back in with highest priority
-        for job in all_jobs:
-            self.queues[0].append(job)
+        return 1 if top_queue else 0
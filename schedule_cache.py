@@ -0,0 +1,56 @@
+"""
+Result caching for the schedulers' schedule() methods
+"""
+
+import copy
+import functools
+import inspect
+from typing import List
+from job import Job
+
+
+def memoize_schedule(*settings: str):
+    """
+    Cache the results of a scheduler's schedule() method.
+
+    A schedule is a deterministic function of the scheduler's settings (the
+    named constructor arguments, stored as attributes of the same name) and
+    each job's inputs, so repeated runs on the same workload are answered from
+    an LRU cache. Every call still gets its own copies of the jobs and metrics.
+    """
+    def decorator(schedule):
+        @functools.lru_cache(maxsize=128)
+        def cached_schedule(scheduler_class, settings_key, jobs_key, options):
+            # Run on a fresh scheduler and jobs rebuilt from the key, so the
+            # result can't depend on anything the key doesn't capture
+            scheduler = scheduler_class(**dict(settings_key))
+            jobs = [Job(job_id, arrival_time, burst_time, burst_time, priority,
+                        io_duration=io_duration, io_operations=io_operations)
+                    for job_id, arrival_time, burst_time, priority, io_duration, io_operations in jobs_key]
+            return schedule(scheduler, jobs, **dict(options))
+
+        signature = inspect.signature(schedule)
+
+        @functools.wraps(schedule)
+        def wrapper(self, jobs: List[Job], *args, **options):
+            if args:
+                # Name positional options (e.g. pre_sorted), so both call styles
+                # are checked against the real signature and share a cache entry
+                bound = signature.bind(self, jobs, *args, **options)
+                options = dict(list(bound.arguments.items())[2:])
+            settings_key = tuple((name, _freeze(getattr(self, name))) for name in settings)
+            jobs_key = tuple((j.job_id, j.arrival_time, j.burst_time, j.priority, j.io_duration,
+                              j.io_operations[j.io_idx:]) for j in jobs)
+            completed, metrics = cached_schedule(type(self), settings_key, jobs_key, tuple(options.items()))
+            return ([copy.copy(job) for job in completed],
+                    {name: copy.copy(value) for name, value in metrics.items()})
+
+        wrapper.cache_clear = cached_schedule.cache_clear
+        wrapper.cache_info = cached_schedule.cache_info
+        return wrapper
+    return decorator
+
+
+def _freeze(value):
+    # Lists (e.g. per-queue quanta) aren't hashable, so key on a tuple instead
+    return tuple(value) if isinstance(value, list) else value
@@ -2,10 +2,51 @@
 Test Cases for CFS (Completely Fair Scheduler)
 """
 
-from mlfq import Job
+import random
+
+from job import Job
 from cfs import CFSScheduler
 
 
+def summary(completed):
+    """(job_id, start_time, completion_time) for each job, sorted by job_id"""
+    return sorted((j.job_id, j.start_time, j.completion_time) for j in completed)
+
+
+def reference_cfs(jobs):
+    """Plain one-time-unit-at-a-time CFS to compare against"""
+    waiting = sorted((job.clone() for job in jobs), key=lambda x: x.arrival_time)
+    vruntime = {}
+    ready = []  # In arrival order, which breaks vruntime ties
+    completed = []
+    current_time = 0
+
+    def admit():
+        while waiting and waiting[0].arrival_time <= current_time:
+            job = waiting.pop(0)
+            vruntime[job.job_id] = min(vruntime.values()) if vruntime else 0
+            ready.append(job)
+
+    while waiting or ready:
+        admit()
+        if not ready:
+            current_time = waiting[0].arrival_time
+            continue
+        job = min(ready, key=lambda j: vruntime[j.job_id])
+        if job.start_time == -1:
+            job.start_time = current_time
+        job.remaining_time -= 1
+        current_time += 1
+        vruntime[job.job_id] += 1
+        admit()
+        if job.remaining_time == 0:
+            job.completion_time = current_time
+            completed.append(job)
+            ready.remove(job)
+            del vruntime[job.job_id]
+    return summary(completed)
+
+
 def test_same_arrival_time():
     """
     Test 1: All jobs arrive at the same time
@@ -158,12 +199,70 @@ def test_equal_jobs():
         print(f"  Job {job.job_id}: turnaround={turnaround}")
 
 
+def test_vruntime_tie_goes_to_first_arrival():
+    """
+    Test 6: On equal vruntime the job that arrived first runs, so two equal
+    jobs alternate one time unit at a time
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=3, remaining_time=3),
+        Job(2, arrival_time=0, burst_time=3, remaining_time=3),
+    ]
+    completed, _ = CFSScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 5), (2, 1, 6)]
+
+
+def test_arrival_mid_run():
+    """
+    Test 7: A job arriving while another runs starts at the running job's
+    vruntime, and loses the tie to it
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=4, remaining_time=4),
+        Job(2, arrival_time=2, burst_time=2, remaining_time=2),  # Job 1 is at vruntime 2 by then
+    ]
+    completed, _ = CFSScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 5), (2, 3, 6)]
+
+
+def test_fractional_arrival():
+    """
+    Test 8: An arrival partway through a time unit is seen at the end of that unit
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=5, remaining_time=5),
+        Job(2, arrival_time=2.5, burst_time=1, remaining_time=1),
+    ]
+    completed, _ = CFSScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 6), (2, 4, 5)]
+
+
+def test_matches_per_tick():
+    """
+    Test 9: Random workloads give the same schedule as per-tick CFS
+    """
+    rng = random.Random(377)
+    for _ in range(300):
+        jobs = []
+        for job_id in range(1, rng.randint(1, 8) + 1):
+            burst = rng.randint(1, 15)
+            arrival = rng.choice([rng.randint(0, 40), rng.randint(0, 80) / 2])
+            jobs.append(Job(job_id, arrival, burst, burst))
+
+        completed, _ = CFSScheduler().schedule(jobs)
+        assert summary(completed) == reference_cfs(jobs)
+
+
 if __name__ == "__main__":
     test_same_arrival_time()
     test_staggered_arrivals()
     test_single_job()
     test_long_vs_short()
     test_equal_jobs()
+    test_vruntime_tie_goes_to_first_arrival()
+    test_arrival_mid_run()
+    test_fractional_arrival()
+    test_matches_per_tick()
     
     print("\n" + "=" * 60)
     print("All CFS tests completed!")
@@ -0,0 +1,90 @@
+"""
+Test Cases for the FIFO (First In First Out) Scheduler
+
+FIFO works out every start and completion time from prefix sums instead of
+stepping through the jobs. These check it against the plain loop.
+"""
+
+import random
+
+from job import Job
+from baselines import FIFOScheduler
+
+
+def summary(completed):
+    """(job_id, start_time, completion_time) for each job, sorted by job_id"""
+    return sorted((j.job_id, j.start_time, j.completion_time) for j in completed)
+
+
+def reference_fifo(jobs):
+    """Plain job-by-job FIFO to compare against"""
+    current_time = 0
+    result = []
+    for job in sorted(jobs, key=lambda x: x.arrival_time):
+        if current_time < job.arrival_time:
+            current_time = job.arrival_time
+        result.append((job.job_id, current_time, current_time + job.burst_time))
+        current_time += job.burst_time
+    return sorted(result)
+
+
+def test_idle_gap_between_jobs():
+    """
+    A job arriving after the previous one finished starts at its arrival,
+    and the jobs behind it queue from there
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=3, remaining_time=3),
+        Job(2, arrival_time=10, burst_time=4, remaining_time=4),  # CPU idle 3-10
+        Job(3, arrival_time=11, burst_time=2, remaining_time=2),
+    ]
+    completed, _ = FIFOScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 3), (2, 10, 14), (3, 14, 16)]
+
+
+def test_late_first_arrival():
+    """
+    Nothing runs before the first job arrives
+    """
+    jobs = [
+        Job(1, arrival_time=7, burst_time=5, remaining_time=5),
+        Job(2, arrival_time=9, burst_time=1, remaining_time=1),
+    ]
+    completed, _ = FIFOScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 7, 12), (2, 12, 13)]
+
+
+def test_arrival_before_time_zero():
+    """
+    The clock starts at 0, so a job listed as arriving earlier starts at 0
+    """
+    jobs = [
+        Job(1, arrival_time=-3, burst_time=2, remaining_time=2),
+        Job(2, arrival_time=1, burst_time=2, remaining_time=2),
+    ]
+    completed, _ = FIFOScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 2), (2, 2, 4)]
+
+
+def test_matches_job_by_job():
+    """
+    Random workloads give the same schedule as the plain FIFO loop
+    """
+    rng = random.Random(377)
+    for _ in range(300):
+        jobs = []
+        for job_id in range(1, rng.randint(1, 8) + 1):
+            burst = rng.randint(1, 15)
+            arrival = rng.choice([rng.randint(-5, 60), rng.randint(0, 120) / 2])
+            jobs.append(Job(job_id, arrival, burst, burst))
+
+        completed, _ = FIFOScheduler().schedule(jobs)
+        assert summary(completed) == reference_fifo(jobs)
+
+
+if __name__ == "__main__":
+    test_idle_gap_between_jobs()
+    test_late_first_arrival()
+    test_arrival_before_time_zero()
+    test_matches_job_by_job()
+    print("All FIFO tests passed!")
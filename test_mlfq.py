@@ -2,7 +2,99 @@
 Test Cases for MLFQ (Multi-Level Feedback Queue) Scheduler
 """
 
-from mlfq import Job, MLFQScheduler
+import random
+from collections import deque
+from itertools import islice
+
+from job import Job
+from mlfq import MLFQScheduler, timeline_expand
+
+
+def reference_mlfq(jobs, num_queues=3, time_quantum=None, time_allotments=None, boost_interval=20):
+    """
+    Plain one-time-unit-at-a-time MLFQ to compare against, returning
+    (job_id, start_time, completion_time) in completion order and the timeline
+    """
+    time_quantum = [2**i for i in range(num_queues)] if time_quantum is None else time_quantum
+    time_allotments = [2*q for q in time_quantum] if time_allotments is None else time_allotments
+    queues = [deque() for _ in range(num_queues)]
+    waiting = deque(sorted((job.clone() for job in jobs), key=lambda x: x.arrival_time))
+    io_points = {id(job): deque(job.io_operations) for job in waiting}
+    io_jobs = []
+    completed = []
+    timeline = []
+    current_job = None
+    quantum_remaining = 0
+    current_time = 0
+    time_since_boost = 0
+    while waiting or any(queues) or current_job or io_jobs:
+        if boost_interval and time_since_boost >= boost_interval:
+            for job in [job for q in queues for job in q] + ([current_job] if current_job else []):
+                job.priority = 0
+                job.time_in_queue = 0
+            queues[0].extend(job for q in queues[1:] for job in q)
+            for q in queues[1:]:
+                q.clear()
+            time_since_boost = 0
+        
+        for job in [job for job in io_jobs if current_time >= job.io_return_time]:
+            io_jobs.remove(job)
+            queues[job.priority].append(job)
+        while waiting and waiting[0].arrival_time <= current_time:
+            job = waiting.popleft()
+            job.priority = 0
+            job.time_in_queue = 0
+            queues[0].append(job)
+        
+        if current_job and current_job.remaining_time <= 0:
+            current_job.completion_time = current_time
+            completed.append(current_job)
+            current_job = None
+        elif current_job and current_job.waiting_for_io:
+            current_job.waiting_for_io = False
+            io_jobs.append(current_job)
+            current_job = None
+        elif current_job and quantum_remaining <= 0:
+            if current_job.time_in_queue >= time_allotments[current_job.priority]:
+                current_job.priority = min(current_job.priority + 1, num_queues - 1)
+                current_job.time_in_queue = 0
+            queues[current_job.priority].append(current_job)
+            current_job = None
+        
+        if not current_job:
+            for priority in range(num_queues):
+                if queues[priority]:
+                    current_job = queues[priority].popleft()
+                    quantum_remaining = time_quantum[priority]
+                    if current_job.start_time == -1:
+                        current_job.start_time = current_time
+                    break
+        
+        if current_job:
+            pending = io_points[id(current_job)]
+            if pending and current_job.burst_time - current_job.remaining_time == pending[0]:
+                pending.popleft()
+                current_job.waiting_for_io = True
+                current_job.io_return_time = current_time + current_job.io_duration
+                timeline.append((current_time, current_job.job_id, current_job.priority, "IO"))
+            else:
+                current_job.remaining_time -= 1
+                current_job.time_in_queue += 1
+                quantum_remaining -= 1
+                timeline.append((current_time, current_job.job_id, current_job.priority, "RUNNING"))
+        else:
+            timeline.append((current_time, -1, -1, "IDLE"))
+        current_time += 1
+        time_since_boost += 1
+    
+    return [(j.job_id, j.start_time, j.completion_time) for j in completed], timeline
+
+
+def check_against_reference(jobs, **options):
+    completed, metrics = MLFQScheduler(**options).schedule(jobs)
+    expected_completed, expected_timeline = reference_mlfq(jobs, **options)
+    assert [(j.job_id, j.start_time, j.completion_time) for j in completed] == expected_completed
+    assert list(timeline_expand(metrics['timeline'])) == expected_timeline
 
 
 def test_priority_demotion():
@@ -27,7 +119,7 @@ def test_priority_demotion():
     
     print("\nTimeline (showing priority changes):")
     prev_priority = -1
-    for time, job_id, priority, status in metrics['timeline'][:20]:
+    for time, job_id, priority, status in islice(timeline_expand(metrics['timeline']), 20):
         if job_id > 0 and priority != prev_priority:
             print(f"  Time {time}: Job {job_id} at Priority {priority}")
             prev_priority = priority
@@ -57,7 +149,7 @@ def test_new_job_priority():
     completed, metrics = scheduler.schedule(jobs)
     
     print("\nTimeline (first 15 time units):")
-    for time, job_id, priority, status in metrics['timeline'][:15]:
+    for time, job_id, priority, status in islice(timeline_expand(metrics['timeline']), 15):
         if job_id > 0:
             print(f"  Time {time}: Job {job_id} at Priority {priority} - {status}")
     
@@ -88,7 +180,7 @@ def test_priority_boost():
     
     print("\nTimeline showing boost effect:")
     prev_priority = {}
-    for time, job_id, priority, status in metrics['timeline']:
+    for time, job_id, priority, status in timeline_expand(metrics['timeline']):
         if job_id > 0:
             if job_id not in prev_priority or prev_priority[job_id] != priority:
                 if prev_priority.get(job_id, -1) > priority:
@@ -119,7 +211,7 @@ def test_round_robin_same_priority():
     completed, metrics = scheduler.schedule(jobs)
     
     print("\nTimeline (should alternate between jobs):")
-    for time, job_id, priority, status in metrics['timeline'][:10]:
+    for time, job_id, priority, status in islice(timeline_expand(metrics['timeline']), 10):
         if job_id > 0:
             print(f"  Time {time}: Job {job_id} at Priority {priority}")
     
@@ -148,7 +240,7 @@ def test_io_behavior():
     completed, metrics = scheduler.schedule(jobs)
     
     print("\nTimeline (first 20 time units):")
-    for time, job_id, priority, status in metrics['timeline'][:20]:
+    for time, job_id, priority, status in islice(timeline_expand(metrics['timeline']), 20):
         if status != "IDLE":
             print(f"  Time {time}: Job {job_id} at Priority {priority} - {status}")
         else:
@@ -183,7 +275,7 @@ def test_multiple_queues():
     
     print("\nPriority level at each time:")
     current_priority = -1
-    for time, job_id, priority, status in metrics['timeline']:
+    for time, job_id, priority, status in timeline_expand(metrics['timeline']):
         if job_id > 0 and priority != current_priority:
             print(f"  Time {time}: Moved to Priority {priority} (quantum={scheduler.time_quantum[priority]})")
             current_priority = priority
@@ -191,6 +283,99 @@ def test_multiple_queues():
     print(f"\nTotal time: {completed[0].completion_time}")
 
 
+def test_non_integer_inputs():
+    """
+    Test 7: Job IDs needn't be ints, and arrivals/IO returns between time units
+    are picked up at the next whole time unit
+    """
+    print("\n" + "=" * 60)
+    print("TEST 7: Non-integer job IDs and arrival times")
+    print("=" * 60)
+    
+    jobs = [
+        Job('A', arrival_time=0, burst_time=7, remaining_time=7,
+            io_operations=[2], io_duration=2.5),  # I/O at CPU time 2, back at 4 + 2.5
+        Job('B', arrival_time=1.5, burst_time=4, remaining_time=4),
+        Job('C', arrival_time=6.2, burst_time=3, remaining_time=3),
+    ]
+    
+    scheduler = MLFQScheduler(num_queues=3, boost_interval=None)
+    completed, metrics = scheduler.schedule(jobs)
+    
+    assert [(j.job_id, j.start_time, j.completion_time) for j in completed] == \
+        [('B', 2, 7), ('C', 7, 12), ('A', 0, 15)]
+    timeline = list(timeline_expand(metrics['timeline']))
+    assert len(timeline) == 16
+    assert timeline[2] == (2, 'B', 0, "RUNNING")  # arrived at 1.5
+    assert timeline[4] == (4, 'A', 1, "IO")
+    assert timeline[7] == (7, 'C', 0, "RUNNING")  # arrived at 6.2
+    print("Job IDs and times handled as in the per-tick simulation")
+
+
+def test_matches_per_tick_edge_cases():
+    """
+    Test 8: Boosts, IO at CPU time 0, repeated IO points and no boosting give
+    the same schedule and timeline as per-tick MLFQ
+    """
+    print("\n" + "=" * 60)
+    print("TEST 8: Edge cases against per-tick MLFQ")
+    print("=" * 60)
+    
+    # Boosts landing mid-quantum, while jobs sit in lower queues
+    check_against_reference([
+        Job(1, arrival_time=0, burst_time=20, remaining_time=20),
+        Job(2, arrival_time=1, burst_time=15, remaining_time=15),
+        Job(3, arrival_time=9, burst_time=6, remaining_time=6),
+    ], boost_interval=7)
+    # A boost while the running job is away for IO
+    check_against_reference([
+        Job(1, arrival_time=0, burst_time=12, remaining_time=12, io_operations=[5], io_duration=6),
+        Job(2, arrival_time=0, burst_time=12, remaining_time=12),
+    ], boost_interval=8)
+    # IO before the job has used any CPU
+    check_against_reference([
+        Job(1, arrival_time=0, burst_time=4, remaining_time=4, io_operations=[0], io_duration=3),
+        Job(2, arrival_time=1, burst_time=3, remaining_time=3, io_operations=[0, 2], io_duration=1),
+    ])
+    # The same IO point twice means back-to-back IO
+    check_against_reference([
+        Job(1, arrival_time=0, burst_time=6, remaining_time=6, io_operations=[3, 3, 3], io_duration=2),
+        Job(2, arrival_time=2, burst_time=5, remaining_time=5, io_operations=[1, 1], io_duration=4),
+    ], boost_interval=10)
+    # No boosting at all, so long jobs sink and stay down
+    check_against_reference([
+        Job(1, arrival_time=0, burst_time=30, remaining_time=30, io_operations=[10], io_duration=2),
+        Job(2, arrival_time=4, burst_time=25, remaining_time=25),
+        Job(3, arrival_time=40, burst_time=2, remaining_time=2),
+    ], boost_interval=None)
+    print("Completed jobs and timelines match per-tick MLFQ")
+
+
+def test_matches_per_tick():
+    """
+    Test 9: Random workloads give the same schedule and timeline as per-tick MLFQ
+    """
+    print("\n" + "=" * 60)
+    print("TEST 9: Random workloads against per-tick MLFQ")
+    print("=" * 60)
+    
+    rng = random.Random(377)
+    for _ in range(300):
+        jobs = []
+        for job_id in range(1, rng.randint(1, 6) + 1):
+            burst = rng.randint(1, 25)
+            arrival = rng.choice([rng.randint(0, 30), rng.randint(0, 60) / 2])
+            io_operations = [rng.randint(0, burst - 1) for _ in range(rng.randint(0, 3))]
+            io_duration = rng.choice([rng.randint(1, 8), rng.randint(1, 16) / 2])
+            jobs.append(Job(job_id, arrival, burst, burst,
+                            io_operations=io_operations, io_duration=io_duration))
+        num_queues = rng.randint(1, 4)
+        boost_interval = rng.choice([None, rng.randint(1, 30)])
+        
+        check_against_reference(jobs, num_queues=num_queues, boost_interval=boost_interval)
+    print("300 random workloads match per-tick MLFQ")
+
+
 if __name__ == "__main__":
     test_priority_demotion()
     test_new_job_priority()
@@ -198,6 +383,9 @@ if __name__ == "__main__":
     test_round_robin_same_priority()
     test_io_behavior()
     test_multiple_queues()
+    test_non_integer_inputs()
+    test_matches_per_tick_edge_cases()
+    test_matches_per_tick()
     
     print("\n" + "=" * 60)
     print("All MLFQ tests completed!")
@@ -0,0 +1,124 @@
+"""
+Test Cases for the Round Robin Scheduler
+
+Round Robin skips whole rotations of the ready queue at once when no job can
+finish and no job can arrive in between. These check the edges of that skip
+against schedules worked out one slice at a time.
+"""
+
+import random
+from collections import deque
+
+from job import Job
+from baselines import RoundRobinScheduler
+
+
+def summary(completed):
+    """(job_id, start_time, completion_time) for each job, sorted by job_id"""
+    return sorted((j.job_id, j.start_time, j.completion_time) for j in completed)
+
+
+def reference_round_robin(jobs, time_quantum):
+    """Plain one-slice-at-a-time Round Robin to compare against"""
+    waiting = deque(sorted(jobs, key=lambda x: x.arrival_time))
+    remaining = {j.job_id: j.burst_time for j in jobs}
+    start, completion = {}, {}
+    ready = deque()
+    current_time = 0
+    while waiting or ready:
+        while waiting and waiting[0].arrival_time <= current_time:
+            ready.append(waiting.popleft())
+        if not ready:
+            current_time = waiting[0].arrival_time
+            continue
+        job = ready.popleft()
+        start.setdefault(job.job_id, current_time)
+        exec_time = min(time_quantum, remaining[job.job_id])
+        remaining[job.job_id] -= exec_time
+        current_time += exec_time
+        while waiting and waiting[0].arrival_time <= current_time:
+            ready.append(waiting.popleft())
+        if remaining[job.job_id] > 0:
+            ready.append(job)
+        else:
+            completion[job.job_id] = current_time
+    return sorted((job_id, start[job_id], completion[job_id]) for job_id in completion)
+
+
+def test_arrival_on_rotation_boundary():
+    """
+    A job arriving exactly when a rotation ends joins the queue before the
+    job that just ran is put back
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=10, remaining_time=10),
+        Job(2, arrival_time=0, burst_time=10, remaining_time=10),
+        Job(3, arrival_time=8, burst_time=3, remaining_time=3),  # 2 rotations of 4
+    ]
+    completed, _ = RoundRobinScheduler(time_quantum=2).schedule(jobs)
+
+    assert summary(completed) == [(1, 0, 21), (2, 2, 23), (3, 10, 17)]
+
+
+def test_job_finishing_at_rotation_end():
+    """
+    Jobs whose remaining time runs out exactly at the end of a rotation
+    finish in that rotation, not one later
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=4, remaining_time=4),
+        Job(2, arrival_time=0, burst_time=6, remaining_time=6),
+    ]
+    completed, _ = RoundRobinScheduler(time_quantum=2).schedule(jobs)
+    assert summary(completed) == [(1, 0, 6), (2, 2, 10)]
+
+    jobs = [
+        Job(1, arrival_time=0, burst_time=6, remaining_time=6),
+        Job(2, arrival_time=0, burst_time=6, remaining_time=6),
+    ]
+    completed, _ = RoundRobinScheduler(time_quantum=2).schedule(jobs)
+    assert summary(completed) == [(1, 0, 10), (2, 2, 12)]
+
+
+def test_quantum_of_one():
+    """
+    With a quantum of 1 every rotation is one time unit per job
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=3, remaining_time=3),
+        Job(2, arrival_time=1, burst_time=2, remaining_time=2),
+        Job(3, arrival_time=1, burst_time=1, remaining_time=1),
+    ]
+    completed, _ = RoundRobinScheduler(time_quantum=1).schedule(jobs)
+    assert summary(completed) == [(1, 0, 6), (2, 1, 5), (3, 2, 3)]
+
+    jobs = [
+        Job(1, arrival_time=0, burst_time=5, remaining_time=5),
+        Job(2, arrival_time=0, burst_time=5, remaining_time=5),
+    ]
+    completed, _ = RoundRobinScheduler(time_quantum=1).schedule(jobs)
+    assert summary(completed) == [(1, 0, 9), (2, 1, 10)]
+
+
+def test_matches_one_slice_at_a_time():
+    """
+    Random workloads give the same schedule as plain slice-by-slice Round Robin
+    """
+    rng = random.Random(377)
+    for _ in range(300):
+        jobs = []
+        for job_id in range(1, rng.randint(1, 8) + 1):
+            burst = rng.randint(1, 30)
+            jobs.append(Job(job_id, rng.randint(0, 40), burst, burst))
+        time_quantum = rng.randint(1, 5)
+
+        completed, _ = RoundRobinScheduler(time_quantum=time_quantum).schedule(jobs)
+        assert summary(completed) == reference_round_robin(jobs, time_quantum)
+
+
+if __name__ == "__main__":
+    test_arrival_on_rotation_boundary()
+    test_job_finishing_at_rotation_end()
+    test_quantum_of_one()
+    test_matches_one_slice_at_a_time()
+    print("All Round Robin tests passed!")
@@ -0,0 +1,78 @@
+"""
+Test Cases for the schedule() result cache
+"""
+
+from job import Job
+from baselines import FIFOScheduler, RoundRobinScheduler
+from mlfq import MLFQScheduler
+
+
+def summary(completed):
+    return [(j.job_id, j.start_time, j.completion_time) for j in completed]
+
+
+def test_positional_options():
+    """
+    Options can be passed positionally, like the undecorated method allows
+    """
+    jobs = [Job(1, 0, 4, 4), Job(2, 1, 2, 2)]
+    scheduler = FIFOScheduler()
+    FIFOScheduler.schedule.cache_clear()
+
+    positional, _ = scheduler.schedule(jobs, True)
+    keyword, _ = scheduler.schedule(jobs, pre_sorted=True)
+
+    assert summary(positional) == summary(keyword) == [(1, 0, 4), (2, 4, 6)]
+    info = FIFOScheduler.schedule.cache_info()
+    assert (info.hits, info.misses) == (1, 1)  # Both call styles share one entry
+
+
+def test_setting_change_misses():
+    """
+    Changing a scheduler setting after construction gives a fresh result
+    """
+    jobs = [Job(1, 0, 3, 3), Job(2, 0, 3, 3)]
+    scheduler = RoundRobinScheduler(time_quantum=2)
+    RoundRobinScheduler.schedule.cache_clear()
+
+    quantum_2, _ = scheduler.schedule(jobs)
+    scheduler.time_quantum = 3
+    quantum_3, _ = scheduler.schedule(jobs)
+
+    assert summary(quantum_2) == [(1, 0, 5), (2, 2, 6)]
+    assert summary(quantum_3) == [(1, 0, 3), (2, 3, 6)]
+    assert RoundRobinScheduler.schedule.cache_info().misses == 2
+
+
+def test_results_are_copies():
+    """
+    Changing returned jobs or metrics doesn't change what later calls get
+    """
+    jobs = [Job(1, 0, 6, 6, io_operations=[2], io_duration=2), Job(2, 1, 3, 3)]
+    scheduler = MLFQScheduler(boost_interval=None)
+    MLFQScheduler.schedule.cache_clear()
+
+    completed, metrics = scheduler.schedule(jobs)
+    expected_jobs = summary(completed)
+    expected_turnaround = list(metrics['turnaround_times'])
+    expected_timeline = list(metrics['timeline'])
+
+    # Scribble over everything that was returned
+    completed[0].completion_time = -99
+    completed.pop()
+    metrics['turnaround_times'].append(1000)
+    metrics['timeline'].starts[0] = 42
+    metrics['timeline'].job_ids[0] = 'changed'
+
+    completed, metrics = scheduler.schedule(jobs)
+    assert MLFQScheduler.schedule.cache_info().hits == 1
+    assert summary(completed) == expected_jobs
+    assert metrics['turnaround_times'] == expected_turnaround
+    assert list(metrics['timeline']) == expected_timeline
+
+
+if __name__ == "__main__":
+    test_positional_options()
+    test_setting_change_misses()
+    test_results_are_copies()
+    print("All schedule cache tests passed!")
@@ -0,0 +1,113 @@
+"""
+Test Cases for the STCF (Shortest Time-to-Completion First) Scheduler
+
+STCF jumps from one arrival or completion to the next instead of running one
+time unit at a time. These check it against a plain per-tick version.
+"""
+
+import random
+
+from job import Job
+from baselines import STCFScheduler
+
+
+def summary(completed):
+    """(job_id, start_time, completion_time) for each job, sorted by job_id"""
+    return sorted((j.job_id, j.start_time, j.completion_time) for j in completed)
+
+
+def reference_stcf(jobs):
+    """Plain one-time-unit-at-a-time STCF to compare against"""
+    remaining = [job.clone() for job in jobs]
+    completed = []
+    current_time = 0
+    while remaining:
+        available = [j for j in remaining if j.arrival_time <= current_time]
+        if not available:
+            current_time = min(j.arrival_time for j in remaining)
+            continue
+        job = min(available, key=lambda x: x.remaining_time)  # Ties go to the job listed first
+        if job.start_time == -1:
+            job.start_time = current_time
+        job.remaining_time -= 1
+        current_time += 1
+        if job.remaining_time == 0:
+            job.completion_time = current_time
+            completed.append(job)
+            remaining.remove(job)
+    return summary(completed)
+
+
+def test_preempted_by_shorter_arrival():
+    """
+    A job arriving with less work left than the running job takes the CPU
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=8, remaining_time=8),
+        Job(2, arrival_time=2, burst_time=3, remaining_time=3),
+    ]
+    completed, _ = STCFScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 11), (2, 2, 5)]
+
+
+def test_tie_keeps_running_job():
+    """
+    An arrival with exactly as much work left doesn't preempt the job
+    listed before it
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=5, remaining_time=5),
+        Job(2, arrival_time=2, burst_time=3, remaining_time=3),  # Job 1 also has 3 left at time 2
+    ]
+    completed, _ = STCFScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 5), (2, 5, 8)]
+
+
+def test_tie_goes_to_job_listed_first():
+    """
+    An arrival listed before the running job takes the CPU when their
+    remaining times tie, as it would be picked first from the same list
+    """
+    jobs = [
+        Job(1, arrival_time=2, burst_time=3, remaining_time=3),
+        Job(2, arrival_time=0, burst_time=5, remaining_time=5),  # 3 left at time 2
+    ]
+    completed, _ = STCFScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 2, 5), (2, 0, 8)]
+
+
+def test_fractional_arrival():
+    """
+    An arrival partway through a time unit is seen at the end of that unit
+    """
+    jobs = [
+        Job(1, arrival_time=0, burst_time=5, remaining_time=5),
+        Job(2, arrival_time=2.5, burst_time=1, remaining_time=1),
+    ]
+    completed, _ = STCFScheduler().schedule(jobs)
+    assert summary(completed) == [(1, 0, 6), (2, 3, 4)]
+
+
+def test_matches_per_tick():
+    """
+    Random workloads give the same schedule as per-tick STCF
+    """
+    rng = random.Random(377)
+    for _ in range(300):
+        jobs = []
+        for job_id in range(1, rng.randint(1, 8) + 1):
+            burst = rng.randint(1, 15)
+            arrival = rng.choice([rng.randint(0, 40), rng.randint(0, 80) / 2])
+            jobs.append(Job(job_id, arrival, burst, burst))
+
+        completed, _ = STCFScheduler().schedule(jobs)
+        assert summary(completed) == reference_stcf(jobs)
+
+
+if __name__ == "__main__":
+    test_preempted_by_shorter_arrival()
+    test_tie_keeps_running_job()
+    test_tie_goes_to_job_listed_first()
+    test_fractional_arrival()
+    test_matches_per_tick()
+    print("All STCF tests passed!")